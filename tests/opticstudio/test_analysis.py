@@ -69,6 +69,17 @@ class TestRayTraceAnalysis:
 
         assert set(result.columns) == expected_columns
         assert set(result.field.unique()) == set(coordinates)
+        assert set(result.wavelength.unique()) == {0.543}
+
+    def test_raytrace_multiple_wavelengths(self, opticstudio_analysis):
+        coordinates = [(0, 0), (1, 1)]
+        wavelengths = [0.543, 0.650]
+
+        result, raytrace_results = opticstudio_analysis.raytrace(coordinates, wavelengths=wavelengths)
+
+        assert len(raytrace_results) == len(coordinates) * len(wavelengths)
+        assert set(result.field.unique()) == set(coordinates)
+        assert set(result.wavelength.unique()) == set(wavelengths)
 
 
 class TestZernikeStandardCoefficientsAnalysis:
@@ -133,6 +144,7 @@ class TestRefractionAnalysis:
         [
             (None, False),
             (0.5, True),
+            (2.0, False),
         ],
     )
     def test_refraction_change_pupil(self, opticstudio_analysis, pupil_diameter, changed_pupil_diameter, monkeypatch):
@@ -1,14 +1,39 @@
 from contextlib import nullcontext as does_not_raise
 
+import numpy as np
 import pytest
 import zospy as zp
 
 from visisipy import EyeModel
-from visisipy.opticstudio.backend import OpticStudioBackend
+from visisipy.opticstudio.backend import OpticStudioBackend, initialize_opticstudio
+from visisipy.opticstudio.models import OpticStudioEye
 
 pytestmark = [pytest.mark.needs_opticstudio]
 
 
+@pytest.mark.parametrize(
+    "zosapi_nethelper,opticstudio_directory,expectation",
+    [
+        (None, None, does_not_raise()),
+        ("ZOSAPI_NetHelper.dll", None, pytest.warns(UserWarning, match="already been initialized")),
+        (None, "OpticStudio", pytest.warns(UserWarning, match="already been initialized")),
+    ],
+)
+def test_initialize_opticstudio_reuses_zos(monkeypatch, zosapi_nethelper, opticstudio_directory, expectation):
+    class MockZOS:
+        def connect(self, mode):
+            return mode
+
+    zos = MockZOS()
+    monkeypatch.setattr("visisipy.opticstudio.backend._ZOS", zos)
+    monkeypatch.setattr("visisipy.opticstudio.backend._ZOS_ARGUMENTS", (None, None))
+
+    with expectation:
+        assert initialize_opticstudio(
+            "extension", zosapi_nethelper=zosapi_nethelper, opticstudio_directory=opticstudio_directory
+        ) == (zos, "extension")
+
+
 class TestOpticStudioBackend:
     def test_initialize_opticstudio(self, opticstudio_backend):
         assert opticstudio_backend.zos is not None
@@ -45,6 +70,46 @@ class TestOpticStudioBackend:
         assert opticstudio_backend.model.eye_model == model
         assert opticstudio_backend.oss.LDE.NumberOfSurfaces == 7
 
+    def test_build_model_twice(self, opticstudio_backend):
+        opticstudio_backend.build_model(EyeModel())
+        opticstudio_backend.build_model(EyeModel())
+
+        assert opticstudio_backend.oss.LDE.NumberOfSurfaces == 7
+
+    def test_build_model_after_new_model(self, opticstudio_backend, monkeypatch):
+        opticstudio_backend.build_model(EyeModel())
+        opticstudio_backend.new_model()
+
+        new_model_called = False
+
+        def mock_new_model(*args, **kwargs):
+            nonlocal new_model_called
+            new_model_called = True
+
+        monkeypatch.setattr(OpticStudioBackend, "new_model", mock_new_model)
+        opticstudio_backend.build_model(EyeModel())
+
+        assert not new_model_called
+        assert opticstudio_backend.oss.LDE.NumberOfSurfaces == 7
+
+    def test_build_model_after_failed_build(self, opticstudio_backend, monkeypatch):
+        opticstudio_backend.build_model(EyeModel())
+        opticstudio_backend.new_model()
+
+        def failing_build(self, oss, **kwargs):
+            oss.LDE.InsertNewSurfaceAt(1)
+            raise RuntimeError("Build failed")
+
+        with monkeypatch.context() as m:
+            m.setattr(OpticStudioEye, "build", failing_build)
+
+            with pytest.raises(RuntimeError, match="Build failed"):
+                opticstudio_backend.build_model(EyeModel())
+
+        opticstudio_backend.build_model(EyeModel())
+
+        assert opticstudio_backend.oss.LDE.NumberOfSurfaces == 7
+
     def test_clear_model(self, opticstudio_backend):
         model = EyeModel()
 
@@ -84,6 +149,27 @@ class TestOpticStudioBackend:
         assert opticstudio_backend.zos is None
         assert opticstudio_backend.oss is None
 
+    def test_analysis_is_cached(self, opticstudio_backend):
+        assert opticstudio_backend.analysis is opticstudio_backend.analysis
+
+    def test_analysis_reset_on_initialize(self, opticstudio_backend):
+        analysis = opticstudio_backend.analysis
+
+        opticstudio_backend.disconnect()
+        opticstudio_backend.initialize(mode="standalone")
+
+        assert opticstudio_backend.analysis is not analysis
+        assert opticstudio_backend.analysis._oss is opticstudio_backend.oss
+
+    def test_initialize_after_disconnect_reuses_zos(self, opticstudio_backend):
+        zos = opticstudio_backend.zos
+
+        opticstudio_backend.disconnect()
+        opticstudio_backend.initialize(mode="standalone")
+
+        assert opticstudio_backend.zos is zos
+        assert opticstudio_backend.oss is not None
+
     @pytest.mark.parametrize(
         "coordinates,field_type,field_constant,expectation",
         [
@@ -124,6 +210,16 @@ class TestOpticStudioBackend:
                 zp.constants.SystemData.FieldType, field_constant
             )
 
+    def test_set_fields_array(self, opticstudio_backend):
+        coordinates = np.array([[0, 0], [1, 2], [-3, 4]])
+
+        opticstudio_backend.set_fields(coordinates)
+
+        assert opticstudio_backend.oss.SystemData.Fields.NumberOfFields == 3
+        for i, (x, y) in enumerate(coordinates):
+            field = opticstudio_backend.oss.SystemData.Fields.GetField(i + 1)
+            assert (field.X, field.Y) == (x, y)
+
     def test_set_wavelengths(self, opticstudio_backend):
         opticstudio_backend.set_wavelengths([0.543, 0.650])
 
@@ -131,9 +227,103 @@ class TestOpticStudioBackend:
         assert opticstudio_backend.oss.SystemData.Wavelengths.GetWavelength(1).Wavelength == 0.543
         assert opticstudio_backend.oss.SystemData.Wavelengths.GetWavelength(2).Wavelength == 0.650
 
+    def test_set_wavelengths_replaces_existing(self, opticstudio_backend):
+        opticstudio_backend.set_wavelengths([0.543, 0.650, 0.700])
+        opticstudio_backend.set_wavelengths([0.450])
+
+        assert opticstudio_backend.oss.SystemData.Wavelengths.NumberOfWavelengths == 1
+        assert opticstudio_backend.oss.SystemData.Wavelengths.GetWavelength(1).Wavelength == 0.450
+
+    def test_set_wavelengths_unchanged(self, opticstudio_backend, monkeypatch):
+        opticstudio_backend.set_wavelengths([0.543, 0.650])
+
+        remove_wavelengths_called = False
+
+        def mock_remove_wavelengths(oss):
+            nonlocal remove_wavelengths_called
+            remove_wavelengths_called = True
+
+        monkeypatch.setattr("visisipy.opticstudio.backend._remove_wavelenghts", mock_remove_wavelengths)
+        opticstudio_backend.set_wavelengths([0.543, 0.650])
+
+        assert not remove_wavelengths_called
+
+    def test_set_wavelengths_changed_in_opticstudio(self, opticstudio_backend):
+        opticstudio_backend.set_wavelengths([0.543, 0.650])
+        opticstudio_backend.oss.SystemData.Wavelengths.GetWavelength(1).Wavelength = 0.600
+
+        opticstudio_backend.set_wavelengths([0.543, 0.650])
+        assert opticstudio_backend.oss.SystemData.Wavelengths.GetWavelength(1).Wavelength == 0.543
+
+        opticstudio_backend.oss.SystemData.Wavelengths.GetWavelength(2).Weight = 0.5
+
+        opticstudio_backend.set_wavelengths([0.543, 0.650])
+        assert opticstudio_backend.oss.SystemData.Wavelengths.GetWavelength(2).Weight == 1.0
+
+    def test_set_fields_unchanged(self, opticstudio_backend, monkeypatch):
+        opticstudio_backend.set_fields([(0, 0), (1, 1)])
+
+        set_fields_called = False
+
+        def mock_set_fields(oss, coordinates):
+            nonlocal set_fields_called
+            set_fields_called = True
+
+        monkeypatch.setattr("visisipy.opticstudio.backend._set_fields", mock_set_fields)
+        opticstudio_backend.set_fields([(0, 0), (1, 1)])
+        assert not set_fields_called
+
+        opticstudio_backend.set_fields([(0, 0), (1, 1)], field_type="object_height")
+        assert not set_fields_called
+        assert opticstudio_backend.oss.SystemData.Fields.GetFieldType() == zp.constants.process_constant(
+            zp.constants.SystemData.FieldType, "ObjectHeight"
+        )
+
+        opticstudio_backend.set_fields([(0, 0), (2, 2)], field_type="object_height")
+        assert set_fields_called
+
+    def test_set_fields_changed_in_opticstudio(self, opticstudio_backend):
+        opticstudio_backend.set_fields([(0, 0), (1, 1)])
+        opticstudio_backend.oss.SystemData.Fields.GetField(1).X = 5
+
+        opticstudio_backend.set_fields([(0, 0), (1, 1)])
+        assert opticstudio_backend.oss.SystemData.Fields.GetField(1).X == 0
+
+        opticstudio_backend.oss.SystemData.Fields.SetFieldType(
+            zp.constants.process_constant(zp.constants.SystemData.FieldType, "ObjectHeight")
+        )
+
+        opticstudio_backend.set_fields([(0, 0), (1, 1)])
+        assert opticstudio_backend.oss.SystemData.Fields.GetFieldType() == zp.constants.process_constant(
+            zp.constants.SystemData.FieldType, "Angle"
+        )
+
     def test_get_wavelength_number(self, opticstudio_backend):
         opticstudio_backend.set_wavelengths([0.543, 0.650])
 
         assert opticstudio_backend.get_wavelength_number(0.543) == 1
         assert opticstudio_backend.get_wavelength_number(0.650) == 2
         assert opticstudio_backend.get_wavelength_number(1.234) is None
+
+    def test_get_wavelength_number_after_set_wavelengths(self, opticstudio_backend):
+        opticstudio_backend.set_wavelengths([0.543, 0.650])
+        assert opticstudio_backend.get_wavelength_number(0.650) == 2
+
+        opticstudio_backend.set_wavelengths([0.650])
+        assert opticstudio_backend.get_wavelength_number(0.650) == 1
+        assert opticstudio_backend.get_wavelength_number(0.543) is None
+
+    def test_get_wavelength_number_changed_in_opticstudio(self, opticstudio_backend):
+        opticstudio_backend.set_wavelengths([0.543, 0.650])
+        assert opticstudio_backend.get_wavelength_number(0.650) == 2
+
+        opticstudio_backend.oss.SystemData.Wavelengths.RemoveWavelength(1)
+
+        assert opticstudio_backend.get_wavelength_number(0.650) == 1
+        assert opticstudio_backend.get_wavelength_number(0.543) is None
+
+    def test_get_wavelength_number_single_wavelength(self, opticstudio_backend):
+        opticstudio_backend.set_wavelengths([0.543])
+
+        assert opticstudio_backend.get_wavelength_number(0.543) == 1
+        assert opticstudio_backend.get_wavelength_number(0.650) is None
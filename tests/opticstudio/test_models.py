@@ -4,6 +4,7 @@ from visisipy import EyeGeometry, EyeMaterials, EyeModel
 from visisipy.models.geometry import StandardSurface, Stop
 from visisipy.models.materials import MaterialModel
 from visisipy.opticstudio import OpticStudioEye
+from visisipy.opticstudio.surfaces import OpticStudioSurface
 
 pytestmark = [pytest.mark.needs_opticstudio]
 
@@ -35,6 +36,14 @@ class TestOpticStudioEye:
 
         assert opticstudio_eye.eye_model == eye_model
 
+    def test_build_restores_update_mode(self, new_oss, eye_model):
+        update_mode = new_oss.UpdateMode
+
+        opticstudio_eye = OpticStudioEye(eye_model)
+        opticstudio_eye.build(new_oss)
+
+        assert new_oss.UpdateMode == update_mode
+
     def test_build_cornea_front(self, new_oss, eye_model):
         opticstudio_eye = OpticStudioEye(eye_model)
         opticstudio_eye.build(new_oss)
@@ -160,6 +169,24 @@ class TestOpticStudioEye:
             "retina": opticstudio_eye.retina,
         }
 
+    def test_surfaces_replace_surface(self, new_oss, eye_model):
+        opticstudio_eye = OpticStudioEye(eye_model)
+        surfaces = opticstudio_eye.surfaces
+
+        assert opticstudio_eye.surfaces is surfaces
+
+        new_pupil = OpticStudioSurface("new pupil", is_stop=True)
+        opticstudio_eye.pupil = new_pupil
+
+        assert opticstudio_eye.surfaces is not surfaces
+        assert opticstudio_eye.surfaces["pupil"] is new_pupil
+
+    def test_surfaces_read_only(self, new_oss, eye_model):
+        opticstudio_eye = OpticStudioEye(eye_model)
+
+        with pytest.raises(TypeError):
+            opticstudio_eye.surfaces["pupil"] = OpticStudioSurface("new pupil", is_stop=True)
+
     def test_update_surfaces(self, new_oss, eye_model):
         opticstudio_eye = OpticStudioEye(eye_model)
         opticstudio_eye.build(new_oss)
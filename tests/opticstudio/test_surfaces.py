@@ -20,6 +20,8 @@ from visisipy.opticstudio.surfaces import (
     OpticStudioSurfaceProperty,
     OpticStudioZernikeStandardPhaseSurface,
     OpticStudioZernikeStandardSagSurface,
+    _comment_index,
+    _suspend_updates,
     make_surface,
 )
 from visisipy.wavefront import ZernikeCoefficients
@@ -155,10 +157,54 @@ class TestOpticStudioSurface:
         assert surface.material == "TEST MATERIAL"  # OpticStudio capitalizes material names
         assert surface.is_stop is bool(is_stop)
 
+    def test_build_restores_update_mode(self, new_oss):
+        update_mode = new_oss.UpdateMode
+
+        OpticStudioSurface(comment="Test").build(new_oss, position=1)
+
+        assert new_oss.UpdateMode == update_mode
+
+    def test_build_nested_suspend_updates(self, new_oss):
+        update_mode = new_oss.UpdateMode
+
+        with _suspend_updates(new_oss):
+            suspended_update_mode = new_oss.UpdateMode
+            OpticStudioSurface(comment="Test").build(new_oss, position=1)
+
+            assert new_oss.UpdateMode == suspended_update_mode
+
+        assert new_oss.UpdateMode == update_mode
+
+    def test_build_updates_automatic_semi_diameter(self, new_oss):
+        surface = OpticStudioSurface(comment="Test", thickness=10.0)
+        surface.build(new_oss, position=1)
+
+        semi_diameter = surface.surface.SemiDiameter
+        new_oss.UpdateStatus()
+
+        assert semi_diameter > 0
+        assert semi_diameter == pytest.approx(surface.surface.SemiDiameter)
+
     def test_is_stop_false_warns(self, new_oss):
         with pytest.warns(UserWarning, match="is_stop is set to False"):
             OpticStudioSurface(comment="Test", is_stop=False).build(new_oss, position=1)
 
+    def test_is_stop_false_warns_on_init(self):
+        with pytest.warns(UserWarning, match="is_stop is set to False"):
+            surface = OpticStudioSurface(comment="Test", is_stop=False)
+
+        assert surface._is_stop is None
+
+    @pytest.mark.parametrize(
+        "surface_class",
+        [OpticStudioSurface, OpticStudioZernikeStandardSagSurface, OpticStudioZernikeStandardPhaseSurface],
+    )
+    def test_is_stop_false_warns_on_init_stacklevel(self, surface_class):
+        with pytest.warns(UserWarning, match="is_stop is set to False") as record:
+            surface_class(comment="Test", is_stop=False)
+
+        assert record[0].filename == __file__
+
     @pytest.mark.parametrize(
         "material_model",
         [
@@ -233,6 +279,46 @@ class TestOpticStudioSurface:
         assert surface.relink_surface(new_oss)
         assert surface.surface.SurfaceNumber == 3
 
+    def test_relink_surface_comment_index(self, new_oss):
+        surface = OpticStudioSurface(comment="Test")
+        surface.build(new_oss, position=2)
+
+        OpticStudioSurface(comment="New test").build(new_oss, position=1)
+
+        assert surface.relink_surface(new_oss, comment_index={"Test": [3], "New test": [1]})
+        assert surface.surface.SurfaceNumber == 3
+        assert not surface.relink_surface(new_oss, comment_index={"Test": [2, 3]})
+        assert not surface.relink_surface(new_oss, comment_index={})
+
+    def test_relink_surface_comment_index_from_system(self, new_oss):
+        surface = OpticStudioSurface(comment="Test")
+        surface.build(new_oss, position=1)
+        duplicate_1 = OpticStudioSurface(comment="Duplicate")
+        duplicate_1.build(new_oss, position=2)
+        duplicate_2 = OpticStudioSurface(comment="Duplicate")
+        duplicate_2.build(new_oss, position=3)
+        empty = OpticStudioSurface(comment="")
+        empty.build(new_oss, position=4)
+
+        comment_index = _comment_index(new_oss)
+
+        assert comment_index["Test"] == [1]
+        assert comment_index["Duplicate"] == [2, 3]
+        assert len(comment_index[""]) > 1
+
+        # The index must give the same result as searching the lens data editor
+        for s in (surface, duplicate_1, duplicate_2, empty):
+            assert s.relink_surface(new_oss, comment_index) == s.relink_surface(new_oss)
+
+        assert surface.relink_surface(new_oss, comment_index)
+        assert surface.surface.SurfaceNumber == 1
+        assert not duplicate_1.relink_surface(new_oss, comment_index)
+        assert duplicate_1.surface.SurfaceNumber == 2
+        assert not duplicate_2.relink_surface(new_oss, comment_index)
+        assert duplicate_2.surface.SurfaceNumber == 3
+        assert not empty.relink_surface(new_oss, comment_index)
+        assert empty.surface.SurfaceNumber == 4
+
     def test_relink_surface_changed_comment(self, new_oss):
         surface = OpticStudioSurface(comment="Test")
         surface.build(new_oss, position=2)
@@ -247,6 +333,44 @@ class TestOpticStudioSurface:
 
         assert surface.surface.TypeName == "ABCD"
 
+    def test_set_surface_type_subclass(self, new_oss):
+        class ABCDSurface(OpticStudioSurface):
+            _TYPE = "ABCD"
+
+        surface = ABCDSurface(comment="Test")
+        surface.build(new_oss, position=1)
+
+        assert ABCDSurface._TYPE == "ABCD"
+        assert surface.surface.TypeName == "ABCD"
+
+        surface._TYPE = "Standard"
+        surface.build(new_oss, position=1, replace_existing=True)
+
+        assert surface.surface.TypeName == "Standard"
+        assert ABCDSurface._TYPE == "ABCD"
+
+    def test_set_surface_type_class_reassigned(self, new_oss):
+        class ABCDSurface(OpticStudioSurface):
+            _TYPE = "Standard"
+
+        ABCDSurface._TYPE = "ABCD"
+
+        surface = ABCDSurface(comment="Test")
+        surface.build(new_oss, position=1)
+
+        assert surface.surface.TypeName == "ABCD"
+
+        surface._TYPE = "Standard"
+        surface.build(new_oss, position=1, replace_existing=True)
+
+        assert surface.surface.TypeName == "Standard"
+        assert ABCDSurface._TYPE == "ABCD"
+
+    def test_no_instance_dict(self):
+        surface = OpticStudioSurface(comment="Test")
+
+        assert not hasattr(surface, "__dict__")
+
 
 class TestBaseOpticStudioZernikeSurface:
     class MockOpticStudioZernikeSurface(BaseOpticStudioZernikeSurface):
@@ -476,6 +600,16 @@ class TestMakeSurface:
         assert opticstudio_surface._thickness == 1
         assert opticstudio_surface._material == "BK7"
 
+    def test_make_surface_subclass(self):
+        class CustomStop(Stop):
+            pass
+
+        opticstudio_surface = make_surface(CustomStop(thickness=1, semi_diameter=2), material="BK7")
+
+        assert type(opticstudio_surface) is OpticStudioSurface
+        assert opticstudio_surface._semi_diameter == 2
+        assert opticstudio_surface._is_stop is True
+
     @pytest.mark.parametrize(
         "radius,thickness,semi_diameter,asphericity,material",
         [
@@ -49,6 +49,8 @@ class EyeModel:
 class BaseSurface(ABC):
     """Abstract class that must be implemented by backend-specific surface classes."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(
         self,
@@ -0,0 +1,60 @@
+"""Lazy import of ZOSPy.
+
+Importing ZOSPy loads Python.NET and resolves the ZOS-API, which takes a noticeable amount of time. The OpticStudio
+backend modules therefore import `zp` from this module, which only executes the actual import when an attribute of
+ZOSPy is first accessed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+__all__ = ("zp",)
+
+
+def _lazy_import(name: str) -> ModuleType:
+    """Import a module lazily.
+
+    The module is registered in `sys.modules`, but its code is only executed when one of its attributes is accessed.
+
+    Parameters
+    ----------
+    name : str
+        Name of the module to import.
+
+    Returns
+    -------
+    ModuleType
+        The lazily loaded module.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If the module cannot be found.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
+
+
+if TYPE_CHECKING:
+    import zospy as zp
+else:
+    zp = _lazy_import("zospy")
@@ -1,20 +1,19 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, NamedTuple
 
 import numpy as np
 import pandas as pd
-import zospy as zp
 from pandas import DataFrame
 
 from visisipy.analysis.cardinal_points import CardinalPoints, CardinalPointsResult
 from visisipy.backend import BaseAnalysis
+from visisipy.opticstudio._zospy import zp
 from visisipy.refraction import FourierPowerVectorRefraction
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
-    from zospy.api import _ZOSAPI
     from zospy.zpcore import OpticStudioSystem
 
     from visisipy.opticstudio.backend import OpticStudioBackend
@@ -22,42 +21,59 @@ if TYPE_CHECKING:
 __all__ = ("OpticStudioAnalysis",)
 
 
-def _iter_fields(oss: OpticStudioSystem) -> tuple[int, _ZOSAPI.SystemData.IField]:
-    for i in range(oss.SystemData.Fields.NumberOfFields):
-        field = oss.SystemData.Fields.GetField(i + 1)
-        yield field.FieldNumber, field
+class _Field(NamedTuple):
+    """Snapshot of a field in the optical system."""
 
+    number: int
+    x: float
+    y: float
+    weight: float
 
-def _iter_wavelengths(oss: OpticStudioSystem) -> tuple[int, float]:
-    for i in range(oss.SystemData.Wavelengths.NumberOfWavelengths):
-        yield i + 1, oss.SystemData.Wavelengths.GetWavelength(i + 1)
+
+def _iter_fields(oss: OpticStudioSystem) -> Iterator[_Field]:
+    fields = oss.SystemData.Fields
+
+    for i in range(fields.NumberOfFields):
+        # Read the field data once, so consumers do not access the ZOS-API for each attribute
+        field = fields.GetField(i + 1)
+        yield _Field(field.FieldNumber, field.X, field.Y, field.Weight)
+
+
+def _iter_wavelengths(oss: OpticStudioSystem) -> Iterator[tuple[int, float]]:
+    wavelengths = oss.SystemData.Wavelengths
+
+    for i in range(wavelengths.NumberOfWavelengths):
+        yield i + 1, wavelengths.GetWavelength(i + 1).Wavelength
 
 
 def _build_cardinal_points_result(cardinal_points_result: zp.analyses.base.AttrDict) -> CardinalPointsResult:
+    image_space = cardinal_points_result.Data["Image Space"]
+    object_space = cardinal_points_result.Data["Object Space"]
+
     return CardinalPointsResult(
         focal_lengths=CardinalPoints(
-            image=cardinal_points_result.Data["Image Space"]["Focal Length"],
-            object=cardinal_points_result.Data["Object Space"]["Focal Length"],
+            image=image_space["Focal Length"],
+            object=object_space["Focal Length"],
         ),
         focal_points=CardinalPoints(
-            image=cardinal_points_result.Data["Image Space"]["Focal Planes"],
-            object=cardinal_points_result.Data["Object Space"]["Focal Planes"],
+            image=image_space["Focal Planes"],
+            object=object_space["Focal Planes"],
         ),
         principal_points=CardinalPoints(
-            image=cardinal_points_result.Data["Image Space"]["Principal Planes"],
-            object=cardinal_points_result.Data["Object Space"]["Principal Planes"],
+            image=image_space["Principal Planes"],
+            object=object_space["Principal Planes"],
         ),
         anti_principal_points=CardinalPoints(
-            image=cardinal_points_result.Data["Image Space"]["Anti-Principal Planes"],
-            object=cardinal_points_result.Data["Object Space"]["Anti-Principal Planes"],
+            image=image_space["Anti-Principal Planes"],
+            object=object_space["Anti-Principal Planes"],
         ),
         anti_nodal_points=CardinalPoints(
-            image=cardinal_points_result.Data["Image Space"]["Anti-Nodal Planes"],
-            object=cardinal_points_result.Data["Object Space"]["Anti-Nodal Planes"],
+            image=image_space["Anti-Nodal Planes"],
+            object=object_space["Anti-Nodal Planes"],
         ),
         nodal_points=CardinalPoints(
-            image=cardinal_points_result.Data["Image Space"]["Nodal Planes"],
-            object=cardinal_points_result.Data["Object Space"]["Nodal Planes"],
+            image=image_space["Nodal Planes"],
+            object=object_space["Nodal Planes"],
         ),
     )
 
@@ -73,11 +89,26 @@ def _build_raytrace_result(raytrace_results: list[DataFrame]) -> DataFrame:
         "Z-coordinate": "z",
     }
 
-    return pd.concat(raytrace_results)[columns.keys()].rename(columns=columns).reset_index()
+    # Select the columns before concatenating, so the unused ray trace data is not copied
+    selected_columns = list(columns)
+    result = pd.concat([raytrace_result[selected_columns] for raytrace_result in raytrace_results])
+
+    return result.rename(columns=columns).reset_index()
 
 
-def _get_zernike_coefficient(zernike_result: zp.analyses.base.AttrDict, coefficient: int) -> float:
-    return zernike_result.Data.Coefficients.loc["Z" + str(coefficient)].Value
+# Zernike terms used to calculate the refraction, grouped by power vector component (M, J0, J45)
+_REFRACTION_ZERNIKE_TERMS = (4, 11, 22, 37, 6, 12, 24, 38, 5, 13, 23, 39)
+_REFRACTION_ZERNIKE_NORMALIZATION = np.array(
+    [
+        *(4 * np.sqrt(3), 12 * np.sqrt(5), 24 * np.sqrt(7), 40 * np.sqrt(9)),
+        *(2 * np.sqrt(6), 6 * np.sqrt(10), 12 * np.sqrt(14), 60 * np.sqrt(2)),
+        *(2 * np.sqrt(6), 6 * np.sqrt(10), 12 * np.sqrt(14), 60 * np.sqrt(2)),
+    ]
+)
+
+
+def _get_zernike_coefficients(zernike_result: zp.analyses.base.AttrDict, coefficients: Iterable[int]) -> np.ndarray:
+    return zernike_result.Data.Coefficients.loc[["Z" + str(c) for c in coefficients], "Value"].to_numpy(dtype=float)
 
 
 def _zernike_data_to_refraction(
@@ -87,20 +118,12 @@ def _zernike_data_to_refraction(
     *,
     use_higher_order_aberrations: bool = True,
 ) -> FourierPowerVectorRefraction:
-    z4 = _get_zernike_coefficient(zernike_data, 4) * wavelength * 4 * np.sqrt(3)
-    z11 = _get_zernike_coefficient(zernike_data, 11) * wavelength * 12 * np.sqrt(5)
-    z22 = _get_zernike_coefficient(zernike_data, 22) * wavelength * 24 * np.sqrt(7)
-    z37 = _get_zernike_coefficient(zernike_data, 37) * wavelength * 40 * np.sqrt(9)
-
-    z6 = _get_zernike_coefficient(zernike_data, 6) * wavelength * 2 * np.sqrt(6)
-    z12 = _get_zernike_coefficient(zernike_data, 12) * wavelength * 6 * np.sqrt(10)
-    z24 = _get_zernike_coefficient(zernike_data, 24) * wavelength * 12 * np.sqrt(14)
-    z38 = _get_zernike_coefficient(zernike_data, 38) * wavelength * 60 * np.sqrt(2)
-
-    z5 = _get_zernike_coefficient(zernike_data, 5) * wavelength * 2 * np.sqrt(6)
-    z13 = _get_zernike_coefficient(zernike_data, 13) * wavelength * 6 * np.sqrt(10)
-    z23 = _get_zernike_coefficient(zernike_data, 23) * wavelength * 12 * np.sqrt(14)
-    z39 = _get_zernike_coefficient(zernike_data, 39) * wavelength * 60 * np.sqrt(2)
+    # Look up all coefficients at once and scale them in a single array operation
+    z4, z11, z22, z37, z6, z12, z24, z38, z5, z13, z23, z39 = (
+        _get_zernike_coefficients(zernike_data, _REFRACTION_ZERNIKE_TERMS)
+        * wavelength
+        * _REFRACTION_ZERNIKE_NORMALIZATION
+    )
 
     exit_pupil_radius = pupil_data.ExitPupilDiameter / 2
 
@@ -153,10 +176,11 @@ class OpticStudioAnalysis(BaseAnalysis):
             If `surface_1` or `surface_2` are not between 1 and the number of surfaces in the system, or if `surface_1`
             is greater than or equal to `surface_2`.
         """
+        last_surface = self._oss.LDE.NumberOfSurfaces - 1
         surface_1 = surface_1 or 1
-        surface_2 = surface_2 or self._oss.LDE.NumberOfSurfaces - 1
+        surface_2 = surface_2 or last_surface
 
-        if surface_1 < 1 or surface_2 > self._oss.LDE.NumberOfSurfaces - 1:
+        if surface_1 < 1 or surface_2 > last_surface:
             raise ValueError("surface_1 and surface_2 must be between 1 and the number of surfaces in the system.")
 
         if surface_1 >= surface_2:
@@ -216,19 +240,22 @@ class OpticStudioAnalysis(BaseAnalysis):
         self._backend.set_wavelengths(wavelengths)
 
         raytrace_results = []
-
-        for wavelength_number, wavelength in _iter_wavelengths(self._backend.oss):
-            for field_number, field in _iter_fields(self._backend.oss):
-                raytrace_result = zp.analyses.raysandspots.single_ray_trace(
-                    self._backend.oss,
+        oss = self._backend.oss
+        single_ray_trace = zp.analyses.raysandspots.single_ray_trace
+        fields = list(_iter_fields(oss))
+
+        for wavelength_number, wavelength in _iter_wavelengths(oss):
+            for field in fields:
+                raytrace_result = single_ray_trace(
+                    oss,
                     px=pupil[0],
                     py=pupil[1],
-                    field=field_number,
+                    field=field.number,
                     wavelength=wavelength_number,
                     global_coordinates=True,
                 ).Data.RealRayTraceData
 
-                raytrace_result.insert(0, "Field", [(field.X, field.Y)] * len(raytrace_result))
+                raytrace_result.insert(0, "Field", [(field.x, field.y)] * len(raytrace_result))
                 raytrace_result.insert(0, "Wavelength", wavelength)
 
                 raytrace_results.append(raytrace_result)
@@ -330,11 +357,15 @@ class OpticStudioAnalysis(BaseAnalysis):
         # Get the wavelength from OpticStudio if not specified
         wavelength = self._oss.SystemData.Wavelengths.GetWavelength(1).Wavelength if wavelength is None else wavelength
 
-        # Temporarily change the pupil diameter
+        # Temporarily change the pupil diameter, unless it is already set to the requested value
         old_pupil_semi_diameter = None
         if pupil_diameter is not None:
-            old_pupil_semi_diameter = self._backend.model.pupil.semi_diameter
-            self._backend.model.pupil.semi_diameter = pupil_diameter / 2
+            pupil = self._backend.model.pupil
+            current_pupil_semi_diameter = pupil.semi_diameter
+
+            if current_pupil_semi_diameter != pupil_diameter / 2:
+                old_pupil_semi_diameter = current_pupil_semi_diameter
+                pupil.semi_diameter = pupil_diameter / 2
 
         pupil_data = zp.functions.lde.get_pupil(self._oss)
         _, zernike_standard_coefficients = self.zernike_standard_coefficients(
@@ -344,7 +375,7 @@ class OpticStudioAnalysis(BaseAnalysis):
         )
 
         if old_pupil_semi_diameter is not None:
-            self._backend.model.pupil.semi_diameter = old_pupil_semi_diameter
+            pupil.semi_diameter = old_pupil_semi_diameter
 
         return _zernike_data_to_refraction(
             zernike_standard_coefficients,
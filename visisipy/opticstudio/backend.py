@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from functools import cache
+from typing import TYPE_CHECKING, Any, Literal
+from warnings import warn
 
-import zospy as zp
+import numpy as np
 
 from visisipy.backend import BaseBackend, _classproperty
+from visisipy.opticstudio._zospy import zp
 from visisipy.opticstudio.analysis import OpticStudioAnalysis
 from visisipy.opticstudio.models import BaseOpticStudioEye, OpticStudioEye
 
@@ -16,50 +19,158 @@ if TYPE_CHECKING:
 
     from visisipy import EyeModel
 
+_ZOS: ZOS | None = None
+_ZOS_ARGUMENTS: tuple[str | None, str | None] | None = None
+
 
 def initialize_opticstudio(
     mode: Literal["standalone", "extension"] = "standalone",
     zosapi_nethelper: str | None = None,
     opticstudio_directory: str | None = None,
 ) -> tuple[ZOS, OpticStudioSystem]:
-    zos = zp.ZOS(zosapi_nethelper=zosapi_nethelper, opticstudio_directory=opticstudio_directory)
-    oss = zos.connect(mode)
+    """Connect to OpticStudio.
+
+    The `ZOS` instance is created only once and reused on subsequent calls, because loading the ZOS-API is expensive
+    and ZOSPy allows only a single `ZOS` instance per process. As a consequence, `zosapi_nethelper` and
+    `opticstudio_directory` only have an effect on the first call, and a warning is issued if they differ on subsequent
+    calls.
+
+    Parameters
+    ----------
+    mode : Literal["standalone", "extension"], optional
+        The mode to use when connecting to OpticStudio. Defaults to "standalone".
+    zosapi_nethelper : str | None, optional
+        The path to the ZOS-API NetHelper DLL. If None, the path is determined automatically.
+    opticstudio_directory : str | None, optional
+        The path to the OpticStudio installation directory. If None, the path is determined automatically.
+
+    Returns
+    -------
+    tuple[ZOS, OpticStudioSystem]
+        The `ZOS` instance and the connected optical system.
+    """
+    global _ZOS, _ZOS_ARGUMENTS  # noqa: PLW0603
+
+    if _ZOS is None:
+        _ZOS = zp.ZOS(zosapi_nethelper=zosapi_nethelper, opticstudio_directory=opticstudio_directory)
+        _ZOS_ARGUMENTS = (zosapi_nethelper, opticstudio_directory)
+    elif (zosapi_nethelper, opticstudio_directory) != _ZOS_ARGUMENTS:
+        warn(
+            "OpticStudio has already been initialized with a different zosapi_nethelper or opticstudio_directory. "
+            "The existing ZOS instance is reused and these arguments have been ignored.",
+            stacklevel=2,
+        )
+
+    oss = _ZOS.connect(mode)
+
+    return _ZOS, oss
+
+
+@cache
+def _field_types() -> dict[str, Any]:
+    # zp.constants is only populated after the ZOS-API has been loaded, so the lookup table is built on first use
+    return {
+        "angle": zp.constants.SystemData.FieldType.Angle,
+        "object_height": zp.constants.SystemData.FieldType.ObjectHeight,
+    }
+
+
+@cache
+def _ray_aiming_methods() -> dict[str, Any]:
+    return {
+        "off": zp.constants.SystemData.RayAimingMethod.Off,
+        "paraxial": zp.constants.SystemData.RayAimingMethod.Paraxial,
+        "real": zp.constants.SystemData.RayAimingMethod.Real,
+    }
+
+
+@cache
+def _float_by_stop_size() -> Any:
+    return zp.constants.SystemData.ZemaxApertureType.FloatByStopSize
+
 
-    return zos, oss
+def _get_ray_aiming_method(ray_aiming: str) -> Any:
+    try:
+        return _ray_aiming_methods()[ray_aiming]
+    except KeyError:
+        raise ValueError("ray_aiming must be either 'off', 'paraxial', or 'real'.") from None
+
+
+def _configure_system(oss: OpticStudioSystem, ray_aiming_method: Any) -> None:
+    oss.SystemData.RayAiming.RayAiming = ray_aiming_method
+    oss.SystemData.Aperture.ApertureType = _float_by_stop_size()
 
 
 def _set_field_type(oss: OpticStudioSystem, field_type: str) -> None:
-    if field_type == "angle":
-        oss.SystemData.Fields.SetFieldType(zp.constants.SystemData.FieldType.Angle)
-    elif field_type == "object_height":
-        oss.SystemData.Fields.SetFieldType(zp.constants.SystemData.FieldType.ObjectHeight)
-    else:
-        raise ValueError("field_type must be either 'angle' or 'object_height'.")
+    try:
+        field_type_constant = _field_types()[field_type]
+    except KeyError:
+        raise ValueError("field_type must be either 'angle' or 'object_height'.") from None
+
+    fields = oss.SystemData.Fields
+
+    if fields.GetFieldType() != field_type_constant:
+        fields.SetFieldType(field_type_constant)
+
+
+def _get_fields(oss: OpticStudioSystem) -> tuple[tuple[float, float, float], ...]:
+    fields = oss.SystemData.Fields
+    result = []
+
+    for i in range(fields.NumberOfFields):
+        field = fields.GetField(i + 1)
+        result.append((field.X, field.Y, field.Weight))
+
+    return tuple(result)
 
 
 def _set_fields(
     oss: OpticStudioSystem,
     coordinates: Iterable[tuple[float, float]],
 ) -> None:
-    oss.SystemData.Fields.DeleteAllFields()
+    coordinates = list(coordinates)
 
-    for i, c in enumerate(coordinates):
-        if i == 0:
-            field = oss.SystemData.Fields.GetField(1)
-            field.X, field.Y, field.Weight = c[0], c[1], 1
-        else:
-            oss.SystemData.Fields.AddField(c[0], c[1], 1)
+    fields = oss.SystemData.Fields
+    fields.DeleteAllFields()
+
+    if len(coordinates) == 0:
+        return
+
+    # DeleteAllFields leaves a single field, which is reused instead of appending a new one
+    field = fields.GetField(1)
+    field.X, field.Y, field.Weight = coordinates[0][0], coordinates[0][1], 1
+
+    add_field = fields.AddField
+
+    for x, y in coordinates[1:]:
+        add_field(x, y, 1)
+
+
+def _get_wavelengths(oss: OpticStudioSystem) -> tuple[tuple[float, float], ...]:
+    wavelengths = oss.SystemData.Wavelengths
+    result = []
+
+    for i in range(wavelengths.NumberOfWavelengths):
+        wavelength = wavelengths.GetWavelength(i + 1)
+        result.append((wavelength.Wavelength, wavelength.Weight))
+
+    return tuple(result)
 
 
 def _remove_wavelenghts(oss: OpticStudioSystem) -> None:
-    while oss.SystemData.Wavelengths.NumberOfWavelengths > 0:
-        oss.SystemData.Wavelengths.RemoveWavelength(1)
+    wavelengths = oss.SystemData.Wavelengths
+
+    # Remove from the end, so OpticStudio does not need to renumber the remaining wavelengths after each removal
+    for i in range(wavelengths.NumberOfWavelengths, 0, -1):
+        wavelengths.RemoveWavelength(i)
 
 
 class OpticStudioBackend(BaseBackend):
     zos: ZOS | None = None
     oss: OpticStudioSystem | None = None
     model: BaseOpticStudioEye | None = None
+    _analysis: OpticStudioAnalysis | None = None
+    _model_is_fresh: bool = False
 
     @_classproperty
     def analysis(cls) -> OpticStudioAnalysis:  # noqa: N805
@@ -82,7 +193,10 @@ class OpticStudioBackend(BaseBackend):
         if cls.oss is None:
             raise RuntimeError("The opticstudio backend has not been initialized.")
 
-        return OpticStudioAnalysis(cls)
+        if cls._analysis is None:
+            cls._analysis = OpticStudioAnalysis(cls)
+
+        return cls._analysis
 
     @classmethod
     def initialize(
@@ -114,8 +228,14 @@ class OpticStudioBackend(BaseBackend):
             zosapi_nethelper=zosapi_nethelper,
             opticstudio_directory=opticstudio_directory,
         )
+        cls._analysis = None
 
-        cls.new_model(ray_aiming=ray_aiming)
+        if mode == "standalone":
+            # A standalone connection starts with a new, empty system, so it only needs to be configured
+            _configure_system(cls.oss, _get_ray_aiming_method(ray_aiming))
+            cls._model_is_fresh = True
+        else:
+            cls.new_model(ray_aiming=ray_aiming)
 
     @classmethod
     def new_model(
@@ -129,18 +249,11 @@ class OpticStudioBackend(BaseBackend):
 
         This method initializes a new optical system model.
         """
-        cls.oss.new(saveifneeded=save_old_model)
+        ray_aiming_method = _get_ray_aiming_method(ray_aiming)
 
-        if ray_aiming == "off":
-            cls.oss.SystemData.RayAiming.RayAiming = zp.constants.SystemData.RayAimingMethod.Off
-        elif ray_aiming == "paraxial":
-            cls.oss.SystemData.RayAiming.RayAiming = zp.constants.SystemData.RayAimingMethod.Paraxial
-        elif ray_aiming == "real":
-            cls.oss.SystemData.RayAiming.RayAiming = zp.constants.SystemData.RayAimingMethod.Real
-        else:
-            raise ValueError("ray_aiming must be either 'off', 'paraxial', or 'real'.")
-
-        cls.oss.SystemData.Aperture.ApertureType = zp.constants.SystemData.ZemaxApertureType.FloatByStopSize
+        cls.oss.new(saveifneeded=save_old_model)
+        _configure_system(cls.oss, ray_aiming_method)
+        cls._model_is_fresh = True
 
     @classmethod
     def build_model(cls, model: EyeModel, *, replace_existing: bool = False, **kwargs) -> OpticStudioEye:
@@ -164,9 +277,13 @@ class OpticStudioBackend(BaseBackend):
         OpticStudioEye
             The built optical system model.
         """
-        if not replace_existing and cls.model is not None:
+        # The system does not need to be reset if nothing has been built since the last reset
+        if not replace_existing and cls.model is not None and not cls._model_is_fresh:
             cls.new_model()
 
+        # Mark the system as changed before building, as a failed build may leave surfaces behind
+        cls._model_is_fresh = False
+
         opticstudio_eye = OpticStudioEye(model)
         opticstudio_eye.build(cls.oss, replace_existing=replace_existing, **kwargs)
 
@@ -183,6 +300,7 @@ class OpticStudioBackend(BaseBackend):
         """
         cls.oss.new(saveifneeded=False)
         cls.model = None
+        cls._model_is_fresh = True
 
     @classmethod
     def save_model(cls, path: str | PathLike | None = None) -> None:
@@ -208,12 +326,15 @@ class OpticStudioBackend(BaseBackend):
         Disconnects the OpticStudio backend.
 
         This method closes the current optical system, sets the system and ZOS instances to None,
-        and disconnects the ZOS instance.
+        and disconnects the ZOS instance. The ZOS instance itself is kept alive, so the backend can be initialized
+        again without reloading the ZOS-API.
         """
         cls.oss.close()
         cls.oss = None
         cls.zos.disconnect()
         cls.zos = None
+        cls._analysis = None
+        cls._model_is_fresh = False
 
     @classmethod
     def set_fields(
@@ -224,18 +345,29 @@ class OpticStudioBackend(BaseBackend):
         """
         Sets the fields for the optical system.
 
-        This method removes any existing fields and adds the new ones provided.
+        This method removes any existing fields and adds the new ones provided. The field type and the fields are
+        only updated if they differ from the values currently set in OpticStudio.
 
         Parameters
         ----------
         coordinates : Iterable[tuple[float, float]]
-            An iterable of tuples representing the coordinates for the fields.
+            An iterable of tuples representing the coordinates for the fields. An array of shape (N, 2) is also
+            accepted.
         field_type : Literal["angle", "object_height"], optional
             The type of field to be used in the optical system. Can be either "angle" or "object_height".
             Defaults to "angle".
         """
+        if isinstance(coordinates, np.ndarray):
+            # Convert to Python floats in a single pass, instead of passing NumPy scalars to the ZOS-API one by one
+            coordinates = coordinates.tolist()
+
+        coordinates = tuple(tuple(c) for c in coordinates)
+
         _set_field_type(cls.oss, field_type)
-        _set_fields(cls.oss, coordinates)
+
+        # Compare with the fields in OpticStudio, as they may have been changed outside visisipy
+        if _get_fields(cls.oss) != tuple((x, y, 1) for x, y in coordinates):
+            _set_fields(cls.oss, coordinates)
 
     @classmethod
     def set_wavelengths(cls, wavelengths: Iterable[float]) -> None:
@@ -243,23 +375,33 @@ class OpticStudioBackend(BaseBackend):
         Sets the wavelengths for the optical system.
 
         This method removes any existing wavelengths and adds the new ones provided.
-        The weight for each wavelength is set to 1.0.
+        The weight for each wavelength is set to 1.0. Nothing is changed if the wavelengths and weights are equal to
+        the values currently set in OpticStudio.
 
         Parameters
         ----------
         wavelengths : Iterable[float]
             An iterable of wavelengths to be set for the optical system.
         """
+        wavelengths = tuple(wavelengths)
+
+        # Compare with the wavelengths in OpticStudio, as they may have been changed outside visisipy
+        if _get_wavelengths(cls.oss) == tuple((w, 1.0) for w in wavelengths):
+            return
+
         _remove_wavelenghts(cls.oss)
 
+        add_wavelength = cls.oss.SystemData.Wavelengths.AddWavelength
+
         for w in wavelengths:
-            cls.oss.SystemData.Wavelengths.AddWavelength(Wavelength=w, Weight=1.0)
+            add_wavelength(Wavelength=w, Weight=1.0)
 
     @classmethod
     def get_wavelength_number(cls, wavelength: float) -> int | None:
         """Returns the wavelength number for the given wavelength.
 
-        If the wavelength is not found, `None` is returned.
+        If the wavelength is not found, `None` is returned. If the wavelength is present multiple times, the number
+        of the first occurrence is returned.
 
         Parameters
         ----------
@@ -271,8 +413,11 @@ class OpticStudioBackend(BaseBackend):
         int | None
             The wavelength number, or `None` if the wavelength is not present.
         """
-        for i in range(cls.oss.SystemData.Wavelengths.NumberOfWavelengths):
-            if cls.oss.SystemData.Wavelengths.GetWavelength(i + 1).Wavelength == wavelength:
+        # The wavelengths are read from OpticStudio on every call, as they may have been changed outside visisipy
+        wavelengths = cls.oss.SystemData.Wavelengths
+
+        for i in range(wavelengths.NumberOfWavelengths):
+            if wavelengths.GetWavelength(i + 1).Wavelength == wavelength:
                 return i + 1
 
         return None
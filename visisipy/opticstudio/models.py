@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from visisipy.models import BaseEye, EyeModel
-from visisipy.opticstudio.surfaces import OpticStudioSurface, make_surface
+from visisipy.opticstudio.surfaces import OpticStudioSurface, _comment_index, _suspend_updates, make_surface
 
 if TYPE_CHECKING:
     from zospy.zpcore import OpticStudioSystem
@@ -95,7 +96,8 @@ class BaseOpticStudioEye(BaseEye):
         bool
             `True` if all surfaces could be relinked, `False` otherwise.
         """
-        result = [s.relink_surface(oss) for s in self.surfaces.values()]
+        comment_index = _comment_index(oss)
+        result = [s.relink_surface(oss, comment_index) for s in self.surfaces.values()]
 
         return all(result)
 
@@ -119,6 +121,28 @@ class OpticStudioEye(BaseOpticStudioEye):
         )
         self._retina = make_surface(eye_model.geometry.retina, eye_model.materials.vitreous, "retina")
 
+        self._surfaces = None
+
+    @property
+    def surfaces(self) -> MappingProxyType[str, OpticStudioSurface]:
+        """Read-only mapping with surface names as keys and surfaces as values.
+
+        The mapping is cached, and recreated when one of the surfaces is replaced.
+        """
+        if self._surfaces is None:
+            self._surfaces = MappingProxyType(
+                {
+                    "cornea_front": self._cornea_front,
+                    "cornea_back": self._cornea_back,
+                    "pupil": self._pupil,
+                    "lens_front": self._lens_front,
+                    "lens_back": self._lens_back,
+                    "retina": self._retina,
+                }
+            )
+
+        return self._surfaces
+
     @property
     def eye_model(self) -> EyeModel:
         return self._eye_model
@@ -131,6 +155,7 @@ class OpticStudioEye(BaseOpticStudioEye):
     @cornea_front.setter
     def cornea_front(self, value: OpticStudioSurface) -> None:
         self._cornea_front = value
+        self._surfaces = None
 
     @property
     def cornea_back(self) -> OpticStudioSurface:
@@ -140,6 +165,7 @@ class OpticStudioEye(BaseOpticStudioEye):
     @cornea_back.setter
     def cornea_back(self, value: OpticStudioSurface) -> None:
         self._cornea_back = value
+        self._surfaces = None
 
     @property
     def pupil(self) -> OpticStudioSurface:
@@ -149,6 +175,7 @@ class OpticStudioEye(BaseOpticStudioEye):
     @pupil.setter
     def pupil(self, value: OpticStudioSurface) -> None:
         self._pupil = value
+        self._surfaces = None
 
     @property
     def lens_front(self) -> OpticStudioSurface:
@@ -158,6 +185,7 @@ class OpticStudioEye(BaseOpticStudioEye):
     @lens_front.setter
     def lens_front(self, value: OpticStudioSurface) -> None:
         self._lens_front = value
+        self._surfaces = None
 
     @property
     def lens_back(self) -> OpticStudioSurface:
@@ -167,6 +195,7 @@ class OpticStudioEye(BaseOpticStudioEye):
     @lens_back.setter
     def lens_back(self, value: OpticStudioSurface) -> None:
         self._lens_back = value
+        self._surfaces = None
 
     @property
     def retina(self) -> OpticStudioSurface:
@@ -176,6 +205,7 @@ class OpticStudioEye(BaseOpticStudioEye):
     @retina.setter
     def retina(self, value: OpticStudioSurface) -> None:
         self._retina = value
+        self._surfaces = None
 
     def build(
         self,
@@ -205,12 +235,13 @@ class OpticStudioEye(BaseOpticStudioEye):
         AssertionError
             If the retina is not located at the IMAGE surface.
         """
-        self.cornea_front.build(oss, position=start_from_index + 1, replace_existing=replace_existing)
-        self.cornea_back.build(oss, position=start_from_index + 2, replace_existing=replace_existing)
-        self.pupil.build(oss, position=start_from_index + 3, replace_existing=True)
-        self.lens_front.build(oss, position=start_from_index + 4, replace_existing=replace_existing)
-        self.lens_back.build(oss, position=start_from_index + 5, replace_existing=replace_existing)
-        self.retina.build(oss, position=start_from_index + 6, replace_existing=True)
+        with _suspend_updates(oss):
+            self.cornea_front.build(oss, position=start_from_index + 1, replace_existing=replace_existing)
+            self.cornea_back.build(oss, position=start_from_index + 2, replace_existing=replace_existing)
+            self.pupil.build(oss, position=start_from_index + 3, replace_existing=True)
+            self.lens_front.build(oss, position=start_from_index + 4, replace_existing=replace_existing)
+            self.lens_back.build(oss, position=start_from_index + 5, replace_existing=replace_existing)
+            self.retina.build(oss, position=start_from_index + 6, replace_existing=True)
 
         # Sanity checks
         if not self.pupil.surface.IsStop:
@@ -337,13 +368,14 @@ class OpticStudioReverseEye(BaseOpticStudioEye):  # pragma: no cover
         start_from_index: int = 0,
         replace_existing: bool = False,
     ):
-        self.retina.build(oss, position=start_from_index, replace_existing=True)
-        self.lens_back.build(oss, position=start_from_index + 1, replace_existing=replace_existing)
-        self.lens_front.build(oss, position=start_from_index + 2, replace_existing=replace_existing)
-        self.iris.build(oss, position=start_from_index + 3, replace_existing=True)
-        self.aqueous.build(oss, position=start_from_index + 4, replace_existing=replace_existing)
-        self.cornea_back.build(oss, position=start_from_index + 5, replace_existing=replace_existing)
-        self.cornea_front.build(oss, position=start_from_index + 6, replace_existing=replace_existing)
+        with _suspend_updates(oss):
+            self.retina.build(oss, position=start_from_index, replace_existing=True)
+            self.lens_back.build(oss, position=start_from_index + 1, replace_existing=replace_existing)
+            self.lens_front.build(oss, position=start_from_index + 2, replace_existing=replace_existing)
+            self.iris.build(oss, position=start_from_index + 3, replace_existing=True)
+            self.aqueous.build(oss, position=start_from_index + 4, replace_existing=replace_existing)
+            self.cornea_back.build(oss, position=start_from_index + 5, replace_existing=replace_existing)
+            self.cornea_front.build(oss, position=start_from_index + 6, replace_existing=replace_existing)
 
         # Sanity checks
         if not self.retina.surface.IsObject:
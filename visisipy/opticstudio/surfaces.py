@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from abc import ABC
-from functools import singledispatch
+import sys
+from abc import ABC, ABCMeta
+from contextlib import contextmanager
+from functools import cache, singledispatch
+from operator import attrgetter
 from typing import TYPE_CHECKING, Generic, TypeVar, Union
 from warnings import warn
 
-import zospy as zp
-
 from visisipy.models import BaseSurface
 from visisipy.models.geometry import (
     StandardSurface,
@@ -17,8 +18,11 @@ from visisipy.models.geometry import (
     ZernikeStandardSagSurface,
 )
 from visisipy.models.materials import MaterialModel
+from visisipy.opticstudio._zospy import zp
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from zospy.api import _ZOSAPI
     from zospy.zpcore import OpticStudioSystem
 
@@ -27,48 +31,221 @@ __all__ = ("OpticStudioSurface", "OpticStudioZernikeStandardSagSurface", "make_s
 PropertyType = TypeVar("PropertyType")
 
 
+@cache
+def _lens_update_mode_none() -> _ZOSAPI.LensUpdateMode:
+    return zp.constants.process_constant(zp.constants.LensUpdateMode, "None")
+
+
+@cache
+def _solve_type_material_model() -> _ZOSAPI.Editors.SolveType:
+    return zp.constants.Editors.SolveType.MaterialModel
+
+
+@cache
+def _surface_type(surface_type: str) -> _ZOSAPI.Editors.LDE.SurfaceType:
+    return zp.constants.process_constant(zp.constants.Editors.LDE.SurfaceType, surface_type)
+
+
+def _comment_index(oss: OpticStudioSystem) -> dict[str, list[int]]:
+    """Map the surface comments in `oss` to the indices of the surfaces with that comment."""
+    lde = oss.LDE
+    index = {}
+
+    for i in range(lde.NumberOfSurfaces):
+        index.setdefault(lde.GetSurfaceAt(i).Comment, []).append(i)
+
+    return index
+
+
+@contextmanager
+def _suspend_updates(oss: OpticStudioSystem) -> Iterator[None]:
+    """Suspend updates of the optical system while making multiple changes.
+
+    OpticStudio updates the system after each change to the lens data. This context manager disables these updates,
+    and restores the previous update mode and updates the system on exit. Nested use for the same system is allowed.
+
+    Parameters
+    ----------
+    oss : zospy.zpcore.OpticStudioSystem
+        OpticStudio system for which updates are suspended.
+    """
+    # OpticStudioSystem only forwards attribute reads to the underlying system
+    system = oss._System  # noqa: SLF001
+
+    # Nested suspensions, e.g. a surface built as part of an eye, find the updates already suspended
+    update_mode = system.UpdateMode
+    if update_mode == _lens_update_mode_none():
+        yield
+        return
+
+    system.UpdateMode = _lens_update_mode_none()
+
+    try:
+        yield
+    finally:
+        system.UpdateMode = update_mode
+
+        # Bring derived data, e.g. automatic semi-diameters, up to date with the changes made while suspended
+        system.UpdateStatus()
+
+
+def _set_material_model(surface: _ZOSAPI.Editors.LDE.ILDERow, material: MaterialModel) -> None:
+    zp.solvers.material_model(
+        surface.MaterialCell,
+        refractive_index=material.refractive_index,
+        abbe_number=material.abbe_number,
+        partial_dispersion=material.partial_dispersion,
+    )
+
+
+def _set_material_name(surface: _ZOSAPI.Editors.LDE.ILDERow, material: str) -> None:
+    surface.Material = material
+
+
+# Material type: function that applies a material of that type to a surface
+_MATERIAL_SETTERS: dict[type, Callable[[_ZOSAPI.Editors.LDE.ILDERow, MaterialModel | str], None]] = {
+    MaterialModel: _set_material_model,
+    str: _set_material_name,
+}
+
+
+def _init_stacklevel(obj: object) -> int:
+    """Stack level for warnings issued in `__init__` that points to the code creating `obj`.
+
+    Subclasses call the `__init__` of their parent classes, so the number of `__init__` frames for `obj` depends on
+    the class of `obj`.
+
+    Parameters
+    ----------
+    obj : object
+        Object that is being initialized.
+
+    Returns
+    -------
+    int
+        Stack level to pass to `warnings.warn` from the `__init__` that calls this function.
+    """
+    frame = sys._getframe(1)  # noqa: SLF001
+    stacklevel = 1
+
+    while frame is not None and frame.f_code.co_name == "__init__" and frame.f_locals.get("self") is obj:
+        frame = frame.f_back
+        stacklevel += 1
+
+    return stacklevel
+
+
 class OpticStudioSurfaceProperty(Generic[PropertyType]):
+    __slots__ = ("name", "_get")
+
     def __init__(self, name: str) -> None:
         self.name = name
+        self._get = attrgetter(name)
 
     def __get__(self, obj: OpticStudioSurface, objtype=None) -> PropertyType:
-        if obj.surface is None:
+        surface = obj.surface
+
+        if surface is None:
             return None
 
-        return getattr(obj.surface, self.name)
+        return self._get(surface)
 
     def __set__(self, obj: OpticStudioSurface, value: PropertyType) -> None:
-        if obj.surface is None:
+        surface = obj.surface
+
+        if surface is None:
             message = f"Cannot set attribute {self.name} of non-built surface."
             raise AttributeError(message)
 
-        setattr(obj.surface, self.name, value)
+        setattr(surface, self.name, value)
 
 
 class OpticStudioSurfaceDataProperty(Generic[PropertyType]):
+    __slots__ = ("name", "_get")
+
     def __init__(self, name: str) -> None:
         self.name = name
+        self._get = attrgetter(f"SurfaceData.{name}")
 
     def __get__(self, obj: OpticStudioSurface, objtype=None) -> PropertyType:
-        if obj.surface is None:
+        surface = obj.surface
+
+        if surface is None:
             return None
 
-        return getattr(obj.surface.SurfaceData, self.name)
+        return self._get(surface)
 
     def __set__(self, obj: OpticStudioSurface, value: PropertyType) -> None:
-        if obj.surface is None:
+        surface = obj.surface
+
+        if surface is None:
             message = f"Cannot set attribute {self.name} of non-built surface."
             raise AttributeError(message)
 
-        setattr(obj.surface.SurfaceData, self.name, value)
+        setattr(surface.SurfaceData, self.name, value)
+
+
+class _SurfaceType:
+    """Surface type of an OpticStudio surface.
+
+    The surface type is defined per class, but can be overridden for individual surfaces by assigning to `_TYPE`.
+    Surfaces use `__slots__`, so the override is stored in a slot instead of the instance `__dict__`.
+    """
+
+    __slots__ = ("default",)
+
+    def __init__(self, default: str) -> None:
+        self.default = default
+
+    def __get__(self, obj: OpticStudioSurface | None, objtype=None) -> str:
+        if obj is None or obj._type_override is None:  # noqa: SLF001
+            return self.default
+
+        return obj._type_override  # noqa: SLF001
+
+    def __set__(self, obj: OpticStudioSurface, value: str) -> None:
+        obj._type_override = value  # noqa: SLF001
+
+
+class _OpticStudioSurfaceMeta(ABCMeta):
+    """Metaclass that keeps the surface type of surface classes overridable for individual surfaces.
+
+    Surface types defined or reassigned as plain strings on a class are wrapped in a `_SurfaceType` descriptor.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        if isinstance(namespace.get("_TYPE"), str):
+            namespace["_TYPE"] = _SurfaceType(namespace["_TYPE"])
+
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __setattr__(cls, name: str, value) -> None:
+        if name == "_TYPE" and isinstance(value, str):
+            value = _SurfaceType(value)
 
+        super().__setattr__(name, value)
 
-class OpticStudioSurface(BaseSurface):
+
+class OpticStudioSurface(BaseSurface, metaclass=_OpticStudioSurfaceMeta):
     """
     Sequential surface in OpticStudio.
     """
 
-    _TYPE: str = "Standard"
+    __slots__ = (
+        "_comment",
+        "_radius",
+        "_thickness",
+        "_semi_diameter",
+        "_conic",
+        "_material",
+        "_is_stop",
+        "_surface",
+        "_surface_data",
+        "_is_built",
+        "_type_override",
+    )
+
+    _TYPE = "Standard"
 
     def __init__(
         self,
@@ -89,8 +266,18 @@ class OpticStudioSurface(BaseSurface):
         self._material = material
         self._is_stop = is_stop
 
+        if is_stop is False:
+            warn(
+                "is_stop is set to False, but this is not supported in OpticStudio. Explicitly setting is_stop will "
+                "always convert the surface to a stop. This setting has been ignored.",
+                stacklevel=_init_stacklevel(self),
+            )
+            self._is_stop = None
+
         self._surface = None
+        self._surface_data = None
         self._is_built = False
+        self._type_override = None
 
     comment: str = OpticStudioSurfaceProperty("Comment")
     radius: float = OpticStudioSurfaceProperty("Radius")
@@ -103,8 +290,10 @@ class OpticStudioSurface(BaseSurface):
         if not self._is_built:
             return None
 
-        if self.surface.MaterialCell.GetSolveData().Type == zp.constants.Editors.SolveType.MaterialModel:
-            material_model = self.surface.MaterialCell.GetSolveData()._S_MaterialModel  # noqa: SLF001
+        solve_data = self.surface.MaterialCell.GetSolveData()
+
+        if solve_data.Type == _solve_type_material_model():
+            material_model = solve_data._S_MaterialModel  # noqa: SLF001
 
             return MaterialModel(
                 refractive_index=material_model.IndexNd,
@@ -118,17 +307,18 @@ class OpticStudioSurface(BaseSurface):
         if material is None:  # Do nothing if material is None
             return
 
-        if isinstance(material, MaterialModel):
-            zp.solvers.material_model(
-                self.surface.MaterialCell,
-                refractive_index=material.refractive_index,
-                abbe_number=material.abbe_number,
-                partial_dispersion=material.partial_dispersion,
-            )
-        elif isinstance(material, str):
-            self.surface.Material = material
-        else:
-            raise TypeError("'material' must be MaterialModel or str.")
+        set_material = _MATERIAL_SETTERS.get(type(material))
+
+        if set_material is None:
+            # Subclasses of the supported material types
+            if isinstance(material, MaterialModel):
+                set_material = _set_material_model
+            elif isinstance(material, str):
+                set_material = _set_material_name
+            else:
+                raise TypeError("'material' must be MaterialModel or str.")
+
+        set_material(self.surface, material)
 
     @property
     def material(self) -> MaterialModel | str:
@@ -147,11 +337,19 @@ class OpticStudioSurface(BaseSurface):
         """
         return self._surface
 
+    def _get_surface_data(self) -> _ZOSAPI.Editors.LDE.ISurface:
+        # The surface data object is only valid for the current surface type, so it is fetched after the type is set
+        if self._surface_data is None:
+            self._surface_data = self.surface.SurfaceData
+
+        return self._surface_data
+
     def _set_surface_type(self):
-        surface_type = zp.constants.process_constant(zp.constants.Editors.LDE.SurfaceType, self._TYPE)
+        surface_type = _surface_type(self._TYPE)
 
         if self.surface is not None and self.surface.Type != surface_type:
             zp.functions.lde.surface_change_type(self.surface, self._TYPE)
+            self._surface_data = None
 
     def build(self, oss: OpticStudioSystem, *, position: int, replace_existing: bool = False):
         """Create the surface in OpticStudio.
@@ -169,33 +367,32 @@ class OpticStudioSurface(BaseSurface):
         replace_existing : bool
             If `True`, replace an existing surface instead of inserting a new one. Defaults to `False`.
         """
-        self._surface = oss.LDE.GetSurfaceAt(position) if replace_existing else oss.LDE.InsertNewSurfaceAt(position)
+        with _suspend_updates(oss):
+            self._surface = oss.LDE.GetSurfaceAt(position) if replace_existing else oss.LDE.InsertNewSurfaceAt(position)
+            self._surface_data = None
 
-        self._set_surface_type()
+            self._set_surface_type()
 
-        self.comment = self._comment
-        self.radius = self._radius
-        self.thickness = self._thickness
-        self.conic = self._conic
+            # Write directly to the new surface, the descriptors' checks for a non-built surface are not needed here
+            surface = self._surface
+            surface.Comment = self._comment
+            surface.Radius = self._radius
+            surface.Thickness = self._thickness
+            surface.Conic = self._conic
 
-        self._set_material(self._material)
+            self._set_material(self._material)
 
-        # Only set semi_diameter when explicitly specified
-        if self._semi_diameter is not None:
-            self.semi_diameter = self._semi_diameter
+            # Only set semi_diameter when explicitly specified
+            if self._semi_diameter is not None:
+                self.semi_diameter = self._semi_diameter
 
-        # Only set IsStop when explicitly specified
-        if self._is_stop is True:
-            self.is_stop = self._is_stop
-        elif self._is_stop is False:
-            warn(
-                "is_stop is set to False, but this is not supported in OpticStudio. Explicitly setting is_stop will "
-                "always convert the surface to a stop. This setting has been ignored."
-            )
+            # Only set IsStop when explicitly specified
+            if self._is_stop:
+                self.is_stop = True
 
-        self._is_built = True
+            self._is_built = True
 
-    def relink_surface(self, oss: OpticStudioSystem) -> bool:
+    def relink_surface(self, oss: OpticStudioSystem, comment_index: dict[str, list[int]] | None = None) -> bool:
         """Link an OpticStudio surface based on its comment.
 
         Searches for a surface in `oss` whose comment matches `self.comment`.
@@ -206,6 +403,9 @@ class OpticStudioSurface(BaseSurface):
         ----------
         oss : zospy.zpcore.OpticStudioSystem
             OpticStudio system in which the eye model is defined.
+        comment_index : dict[str, list[int]] | None, optional
+            Mapping from surface comments to surface indices in `oss`. When relinking multiple surfaces, this avoids
+            searching the lens data editor for every surface. If `None`, the lens data editor is searched directly.
 
         Returns
         -------
@@ -214,10 +414,15 @@ class OpticStudioSurface(BaseSurface):
             no / multiple surfaces have been found.
         """
         if self._is_built:
-            surfaces = zp.functions.lde.find_surface_by_comment(oss.LDE, self._comment)
+            if comment_index is not None:
+                indices = comment_index.get(self._comment, [])
+                surfaces = [oss.LDE.GetSurfaceAt(indices[0])] if len(indices) == 1 else []
+            else:
+                surfaces = zp.functions.lde.find_surface_by_comment(oss.LDE, self._comment)
 
             if len(surfaces) == 1:
                 self._surface = surfaces[0]
+                self._surface_data = None
 
                 return True
 
@@ -230,6 +435,8 @@ class BaseOpticStudioZernikeSurface(OpticStudioSurface, ABC):
     This class provides methods and properties shared by all Zernike surfaces.
     """
 
+    __slots__ = ("_number_of_terms", "_norm_radius", "_zernike_coefficients")
+
     def __new__(cls, *args, **kwargs):  # noqa: ARG003
         if cls is BaseOpticStudioZernikeSurface:
             raise TypeError("Only child classes of BaseOpticStudioZernikeSurface may be instantiated.")
@@ -273,11 +480,14 @@ class BaseOpticStudioZernikeSurface(OpticStudioSurface, ABC):
     number_of_terms: int = OpticStudioSurfaceDataProperty("NumberOfTerms")
     norm_radius: float = OpticStudioSurfaceDataProperty("NormRadius")
 
-    def _validate_coefficient(self, n: int):
+    def _validate_coefficient(self, n: int, maximum_term: int | None = None):
+        if maximum_term is None:
+            maximum_term = self.number_of_terms
+
         if n < 1:
             raise ValueError("Zernike coefficient must be larger than 0.")
-        if n > self.number_of_terms:
-            raise ValueError(f"Zernike coefficient must be smaller than the maximum term {self.number_of_terms}.")
+        if n > maximum_term:
+            raise ValueError(f"Zernike coefficient must be smaller than the maximum term {maximum_term}.")
 
     def get_zernike_coefficient(self, n: int) -> float:
         """Get the value of the nth Zernike coefficient.
@@ -299,7 +509,7 @@ class BaseOpticStudioZernikeSurface(OpticStudioSurface, ABC):
         """
         self._validate_coefficient(n)
 
-        return self.surface.SurfaceData.GetNthZernikeCoefficient(n)
+        return self._get_surface_data().GetNthZernikeCoefficient(n)
 
     def set_zernike_coefficient(self, n: int, value: float) -> None:
         """Set the value of the nth Zernike coefficient.
@@ -318,7 +528,7 @@ class BaseOpticStudioZernikeSurface(OpticStudioSurface, ABC):
         """
         self._validate_coefficient(n)
 
-        self.surface.SurfaceData.SetNthZernikeCoefficient(n, value)
+        self._get_surface_data().SetNthZernikeCoefficient(n, value)
 
     def build(self, oss: OpticStudioSystem, *, position: int, replace_existing: bool = False):
         """Create the surface in OpticStudio.
@@ -336,18 +546,26 @@ class BaseOpticStudioZernikeSurface(OpticStudioSurface, ABC):
         replace_existing : bool
             If `True`, replace an existing surface instead of inserting a new one. Defaults to `False`.
         """
-        super().build(oss, position=position, replace_existing=replace_existing)
+        with _suspend_updates(oss):
+            super().build(oss, position=position, replace_existing=replace_existing)
+
+            surface_data = self._get_surface_data()
+            surface_data.NumberOfTerms = self._number_of_terms
+            surface_data.NormRadius = self._norm_radius
 
-        self.number_of_terms = self._number_of_terms
-        self.norm_radius = self._norm_radius
+            # Read the number of terms only once, instead of for every coefficient
+            maximum_term = surface_data.NumberOfTerms
 
-        for n, value in self._zernike_coefficients.items():
-            self.set_zernike_coefficient(n, value)
+            for n, value in self._zernike_coefficients.items():
+                self._validate_coefficient(n, maximum_term)
+                surface_data.SetNthZernikeCoefficient(n, value)
 
 
 class OpticStudioZernikeStandardSagSurface(BaseOpticStudioZernikeSurface):
     """Zernike Standard Sag surface in OpticStudio."""
 
+    __slots__ = ("_extrapolate", "_zernike_decenter_x", "_zernike_decenter_y")
+
     _TYPE = "ZernikeStandardSag"
 
     def __init__(
@@ -404,16 +622,20 @@ class OpticStudioZernikeStandardSagSurface(BaseOpticStudioZernikeSurface):
         replace_existing : bool
             If `True`, replace an existing surface instead of inserting a new one. Defaults to `False`.
         """
-        super().build(oss, position=position, replace_existing=replace_existing)
+        with _suspend_updates(oss):
+            super().build(oss, position=position, replace_existing=replace_existing)
 
-        self.extrapolate = self._extrapolate
-        self.zernike_decenter_x = self._zernike_decenter_x
-        self.zernike_decenter_y = self._zernike_decenter_y
+            surface_data = self._get_surface_data()
+            surface_data.Extrapolate = self._extrapolate
+            surface_data.ZernikeDecenter_X = self._zernike_decenter_x
+            surface_data.ZernikeDecenter_Y = self._zernike_decenter_y
 
 
 class OpticStudioZernikeStandardPhaseSurface(BaseOpticStudioZernikeSurface):
     """Zernike Standard Phase surface in OpticStudio."""
 
+    __slots__ = ("_extrapolate", "_diffract_order")
+
     _TYPE = "ZernikeStandardPhase"
 
     def __init__(
@@ -467,10 +689,12 @@ class OpticStudioZernikeStandardPhaseSurface(BaseOpticStudioZernikeSurface):
         replace_existing : bool
             If `True`, replace an existing surface instead of inserting a new one. Defaults to `False`.
         """
-        super().build(oss, position=position, replace_existing=replace_existing)
+        with _suspend_updates(oss):
+            super().build(oss, position=position, replace_existing=replace_existing)
 
-        self.extrapolate = self._extrapolate
-        self.diffract_order = self._diffract_order
+            surface_data = self._get_surface_data()
+            surface_data.Extrapolate = self._extrapolate
+            surface_data.DiffractOrder = self._diffract_order
 
 
 @singledispatch